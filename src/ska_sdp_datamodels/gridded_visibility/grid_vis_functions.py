@@ -48,7 +48,7 @@ def convert_hdf_to_griddata(f):
     :return: GridData
     """
     assert f.attrs["data_model"] == "GridData", "Not a GridData"
-    data = numpy.array(f["data"])
+    data = f["data"][()]
     grid_wcs = WCS(f.attrs["grid_wcs"])
     polarisation_frame = PolarisationFrame(f.attrs["polarisation_frame"])
 
@@ -132,7 +132,7 @@ def convert_hdf_to_convolutionfunction(f):
     assert f.attrs["data_model"] == "ConvolutionFunction", f.attrs[
         "data_model"
     ]
-    data = numpy.array(f["data"])
+    data = f["data"][()]
     polarisation_frame = PolarisationFrame(f.attrs["polarisation_frame"])
     cf_wcs = WCS(f.attrs["grid_wcs"])
     gd = ConvolutionFunction.constructor(
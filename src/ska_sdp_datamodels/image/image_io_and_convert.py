@@ -47,7 +47,7 @@ def convert_hdf_to_image(f):
     if "data_model" in f.attrs.keys() and f.attrs["data_model"] == "Image":
         polarisation_frame = PolarisationFrame(f.attrs["polarisation_frame"])
         wcs = WCS(f.attrs["wcs"])
-        data = numpy.array(f["data"])
+        data = f["data"][()]
         im = Image.constructor(
             data=data, polarisation_frame=polarisation_frame, wcs=wcs
         )
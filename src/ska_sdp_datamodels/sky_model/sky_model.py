@@ -103,16 +103,16 @@ class SkyComponent:
 
     def __str__(self):
         """Default printer for SkyComponent"""
-        s = "SkyComponent:\n"
-        s += f"\tName: {self.name}\n"
-        s += f"\tFlux: {self.flux}\n"
-        s += f"\tFrequency: {self.frequency}\n"
-        s += f"\tDirection: {self.direction}\n"
-        s += f"\tShape: {self.shape}\n"
-
-        s += f"\tParams: {self.params}\n"
-        s += f"\tPolarisation frame: {str(self.polarisation_frame.type)}\n"
-        return s
+        return (
+            "SkyComponent:\n"
+            f"\tName: {self.name}\n"
+            f"\tFlux: {self.flux}\n"
+            f"\tFrequency: {self.frequency}\n"
+            f"\tDirection: {self.direction}\n"
+            f"\tShape: {self.shape}\n"
+            f"\tParams: {self.params}\n"
+            f"\tPolarisation frame: {str(self.polarisation_frame.type)}\n"
+        )
 
 
 class SkyModel:
@@ -183,20 +183,14 @@ class SkyModel:
 
     def __str__(self):
         """Default printer for SkyModel"""
-        s = f"SkyModel: fixed: {self.fixed}\n"
-        for _, sc in enumerate(self.components):
-            s += str(sc)
-        s += "\n"
-
-        s += str(self.image)
-        s += "\n"
-
-        s += str(self.mask)
-        s += "\n"
-
-        s += str(self.gaintable)
-
-        return s
+        parts = [f"SkyModel: fixed: {self.fixed}\n"]
+        parts.extend(str(sc) for sc in self.components)
+        parts.append("\n")
+        parts.append(f"{self.image}\n")
+        parts.append(f"{self.mask}\n")
+        parts.append(str(self.gaintable))
+
+        return "".join(parts)
 
     def copy(self):
         """Copy a SkyModel"""
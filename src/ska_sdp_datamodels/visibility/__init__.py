@@ -15,10 +15,15 @@ from .vis_io_ms import (
     create_visibility_from_ms,
     export_visibility_to_ms,
     extend_visibility_to_ms,
-    generate_baselines,
     list_ms,
 )
 from .vis_model import FlagTable, Visibility
+from .vis_utils import (
+    generate_baseline_keys,
+    generate_baselines,
+    generate_baselines_array,
+    unpack_baseline_keys,
+)
 
 __all__ = [
     "Visibility",
@@ -38,4 +43,7 @@ __all__ = [
     "extend_visibility_to_ms",
     "list_ms",
     "generate_baselines",
+    "generate_baselines_array",
+    "generate_baseline_keys",
+    "unpack_baseline_keys",
 ]
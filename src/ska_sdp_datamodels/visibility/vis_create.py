@@ -25,7 +25,7 @@ from ska_sdp_datamodels.science_data_model import (
 from ska_sdp_datamodels.visibility.vis_model import FlagTable, Visibility
 from ska_sdp_datamodels.visibility.vis_utils import (
     calculate_transit_time,
-    generate_baselines,
+    generate_baselines_array,
 )
 
 log = logging.getLogger("data-models-logger")
@@ -181,11 +181,22 @@ def create_visibility(
     nants = len(config["names"].data)
     diameter = config["diameter"].data
     max_diameter_square = numpy.max(diameter) ** 2
-    baselines = pandas.MultiIndex.from_tuples(
-        generate_baselines(nants), names=("antenna1", "antenna2")
+    ant1, ant2 = generate_baselines_array(nants)
+    baselines = pandas.MultiIndex.from_arrays(
+        (ant1, ant2), names=("antenna1", "antenna2")
     )
     nbaselines = len(baselines)
 
+    # The weight of the different diameter antennas needs to be
+    # calculated, respectively (same equation as CASA).
+    # Auto-correlations are zero-weighted.
+    baseline_weight = numpy.where(
+        ant1 != ant2,
+        weight
+        / ((max_diameter_square / (diameter[ant1] * diameter[ant2])) ** 2),
+        0.0,
+    )
+
     # Find the number of integrations above elevation_limit
     ntimes = 0
     n_flagged = 0
@@ -255,27 +266,14 @@ def create_visibility(
         # the array for this hour angle and declination
         _, elevation = hadec_to_azel(ha, phasecentre.dec.rad, latitude)
         if elevation_limit is None or (elevation > elevation_limit):
-            rweight[itime, ...] = 1.0
-            rflags[itime, ...] = 1
+            rweight[itime, ...] = baseline_weight[
+                :, numpy.newaxis, numpy.newaxis
+            ]
+            rflags[itime, ...] = 0
 
-            # Loop over all pairs of antennas. Note that a2>a1
+            # All pairs of antennas at once. Note that a2>=a1
             ant_pos = xyz_to_uvw(ants_xyz, ha, phasecentre.dec.rad)
-
-            for ibaseline, (a1, a2) in enumerate(baselines):
-                if a1 != a2:
-                    # The weight of the different diameter antennas needs to be
-                    # calculated, respectively (same equation as CASA).
-                    rweight[itime, ibaseline, ...] = weight / (
-                        (max_diameter_square / (diameter[a1] * diameter[a2]))
-                        ** 2
-                    )
-                    rflags[itime, ibaseline, ...] = 0
-                else:
-                    rweight[itime, ibaseline, ...] = 0.0
-                    rflags[itime, ibaseline, ...] = 1
-
-                ruvw[itime, ibaseline, :] = ant_pos[a2, :] - ant_pos[a1, :]
-                rflags[itime, ibaseline, ...] = 0
+            ruvw[itime, ...] = ant_pos[ant2, :] - ant_pos[ant1, :]
 
             if itime > 0:
                 rintegrationtime[itime] = rtimes[itime] - rtimes[itime - 1]
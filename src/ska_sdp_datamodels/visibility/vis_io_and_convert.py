@@ -22,7 +22,7 @@ from ska_sdp_datamodels.configuration import (
 )
 from ska_sdp_datamodels.science_data_model import PolarisationFrame
 from ska_sdp_datamodels.visibility.vis_model import FlagTable, Visibility
-from ska_sdp_datamodels.visibility.vis_utils import generate_baselines
+from ska_sdp_datamodels.visibility.vis_utils import generate_baselines_array
 
 
 def convert_visibility_to_hdf(vis: Visibility, f):
@@ -101,8 +101,8 @@ def convert_hdf_to_visibility(f):
     config = convert_configuration_from_hdf(f)
     nants = len(config["names"].data)
 
-    baselines = pandas.MultiIndex.from_tuples(
-        generate_baselines(nants),
+    baselines = pandas.MultiIndex.from_arrays(
+        generate_baselines_array(nants),
         names=("antenna1", "antenna2"),
     )
 
@@ -165,8 +165,8 @@ def convert_hdf_to_flagtable(f):
     assert f.attrs["data_model"] == "FlagTable", "Not a FlagTable"
     nants = f.attrs["nants"]
 
-    baselines = pandas.MultiIndex.from_tuples(
-        generate_baselines(nants), names=("antenna1", "antenna2")
+    baselines = pandas.MultiIndex.from_arrays(
+        generate_baselines_array(nants), names=("antenna1", "antenna2")
     )
     polarisation_frame = PolarisationFrame(f.attrs["polarisation_frame"])
     frequency = f["data_frequency"][()]
@@ -24,7 +24,13 @@ from ska_sdp_datamodels.science_data_model.polarisation_model import (
     ReceptorFrame,
 )
 from ska_sdp_datamodels.visibility.vis_model import Visibility
-from ska_sdp_datamodels.visibility.vis_utils import generate_baselines
+from ska_sdp_datamodels.visibility.vis_utils import generate_baselines_array
+
+# Kept importable from this module for backwards compatibility
+# pylint: disable-next=unused-import
+from ska_sdp_datamodels.visibility.vis_utils import (  # noqa: F401 isort: skip
+    generate_baselines,
+)
 
 log = logging.getLogger("data-models-logger")
 
@@ -498,8 +504,8 @@ def create_visibility_from_ms(
             antenna1 = list(map(lambda i: ant_map[i], antenna1))
             antenna2 = list(map(lambda i: ant_map[i], antenna2))
 
-            baselines = pandas.MultiIndex.from_tuples(
-                generate_baselines(nants), names=("antenna1", "antenna2")
+            baselines = pandas.MultiIndex.from_arrays(
+                generate_baselines_array(nants), names=("antenna1", "antenna2")
             )
             nbaselines = len(baselines)
 
@@ -17,6 +17,7 @@ from ska_sdp_datamodels.science_data_model import (
     PolarisationFrame,
     QualityAssessment,
 )
+from ska_sdp_datamodels.visibility.vis_utils import generate_baselines_array
 from ska_sdp_datamodels.xarray_accessor import XarrayAccessorMixin
 
 
@@ -336,6 +337,7 @@ class VisibilityAccessor(XarrayAccessorMixin):
     def __init__(self, xarray_obj):
         super().__init__(xarray_obj)
         self._uvw_lambda = None
+        self._utc_time = None
 
     @property
     def rows(self):
@@ -412,6 +414,24 @@ class VisibilityAccessor(XarrayAccessorMixin):
 
         self._uvw_lambda = new_value
 
+    @property
+    def utc_time(self):
+        """
+        Time samples as an astropy Time (UTC) [ntimes]
+        Note: The Time object is cached and rebuilt whenever
+            the time values differ from those it was built from
+        """
+        time = self._obj["time"].data
+        if self._utc_time is None or not numpy.array_equal(
+            self._utc_time[0], time
+        ):
+            self._utc_time = (
+                numpy.array(time),
+                Time(time / 86400.0, format="mjd", scale="utc"),
+            )
+
+        return self._utc_time[1]
+
     @property
     def u(self):
         """u coordinate (metres) [nrows, nbaseline]"""
@@ -568,15 +588,12 @@ class VisibilityAccessor(XarrayAccessorMixin):
         )
 
         # The baselines coord now is missing the antenna1, antenna2 keys
-        # so we add those back
-        def generate_baselines(baseline_id):
-            for a1 in baseline_id:
-                for a2 in baseline_id:
-                    if a2 >= a1:
-                        yield a1, a2
-
-        sub_bvis["baselines"] = pandas.MultiIndex.from_tuples(
-            generate_baselines(ids),
+        # so we add those back. The selected baselines keep their
+        # original (antenna1 <= antenna2) order, so the ids must be sorted
+        ids = numpy.sort(ids)
+        ant1, ant2 = generate_baselines_array(len(ids))
+        sub_bvis["baselines"] = pandas.MultiIndex.from_arrays(
+            [ids[ant1], ids[ant2]],
             names=("antenna1", "antenna2"),
         )
         return sub_bvis
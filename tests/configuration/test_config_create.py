@@ -46,9 +46,9 @@ def test_limit_rmax(rmax):
             [550.0, 340.0, -230.0],
         ]
     )
-    diameters = numpy.array([38.0] * 6)
+    diameters = numpy.full(6, 38.0)
     names = numpy.array(["SKA1", "SKA2", "SKA3", "SKA4", "SKA5", "SKA6"])
-    mounts = numpy.array(["XY"] * 6)
+    mounts = numpy.full(6, "XY")
 
     result = _limit_rmax(xyz_coords, diameters, names, mounts, rmax)
 
@@ -79,6 +79,7 @@ def image_fixture(phase_centre):
         phasecentre=phase_centre,
         frequency=1.0e8,
         polarisation_frame=PolarisationFrame("stokesIQUV"),
+        dtype=numpy.float32,
     )
     return image
 
@@ -60,7 +60,7 @@ def fixture_griddata():
     """
     Generate a simple grid data object using GridData.constructor.
     """
-    data = numpy.ones((N_CHAN, N_POL, NV, NU))
+    data = numpy.ones((N_CHAN, N_POL, NV, NU), dtype=numpy.float32)
     pol_frame = PolarisationFrame("stokesIV")
     grid_wcs = WCS(header=GD_WCS_HEADER, naxis=4)
     grid_data = GridData.constructor(data, pol_frame, grid_wcs)
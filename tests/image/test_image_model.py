@@ -44,7 +44,7 @@ def fixture_image():
     """
     Generate a simple image using Image.constructor.
     """
-    data = numpy.ones((N_CHAN, N_POL, Y, X))
+    data = numpy.ones((N_CHAN, N_POL, Y, X), dtype=numpy.float32)
     pol_frame = PolarisationFrame("stokesIV")
     wcs = WCS(header=WCS_HEADER, naxis=4)
     image = Image.constructor(data, pol_frame, wcs, clean_beam=CLEAN_BEAM)
@@ -110,7 +110,7 @@ def test_constructor_clean_beam_missing_key():
     doesn't contain all the keys of ["bmaj", "bmin", "bpa"].
     """
 
-    data = numpy.ones((N_CHAN, N_POL, Y, X))
+    data = numpy.ones((N_CHAN, N_POL, Y, X), dtype=numpy.float32)
     pol_frame = PolarisationFrame("stokesIV")
     wcs = WCS(header=WCS_HEADER, naxis=4)
 
@@ -145,7 +145,7 @@ def test_is_canonical_false():
     del new_header["CTYPE4"]
     del new_header["CUNIT4"]
 
-    data = numpy.ones((N_CHAN, N_POL, Y, X))
+    data = numpy.ones((N_CHAN, N_POL, Y, X), dtype=numpy.float32)
     pol_frame = PolarisationFrame("stokesIV")
     wcs = WCS(header=new_header, naxis=4)
     image = Image.constructor(data, pol_frame, wcs, clean_beam=None)
@@ -6,7 +6,9 @@ Unit tests to creating Visibilities
 
 import numpy
 import pytest
+from astropy.time import Time
 
+from ska_sdp_datamodels.configuration import create_named_configuration
 from ska_sdp_datamodels.science_data_model import PolarisationFrame
 from ska_sdp_datamodels.visibility import (
     create_flagtable_from_visibility,
@@ -82,6 +84,50 @@ def test_create_visibility_polarisation(low_aa05_config, phase_centre):
     assert (vis.polarisation.data == ["I"]).all()
 
 
+def test_create_visibility_baseline_weight_and_uvw(phase_centre):
+    """
+    Baseline weights are scaled by the antenna diameters (same
+    equation as CASA), auto-correlations have zero weight, and
+    the uvw of each baseline is the difference of the positions
+    of its two antennas.
+    """
+    config = create_named_configuration("MID")
+    times = Time(["2020-01-01T12:00:00"], format="isot", scale="utc")
+    vis = create_visibility(
+        config,
+        times,
+        numpy.array([1.0e9]),
+        channel_bandwidth=numpy.array([1.0e6]),
+        phasecentre=phase_centre,
+        polarisation_frame=PolarisationFrame("stokesI"),
+        elevation_limit=None,
+        times_are_ha=False,
+    )
+
+    ant1 = vis.baselines.antenna1.data
+    ant2 = vis.baselines.antenna2.data
+    autocorr = ant1 == ant2
+    diameter = config["diameter"].data
+    weight = vis.weight.data[0, :, 0, 0]
+    expected_weight = (
+        diameter[ant1] * diameter[ant2] / numpy.max(diameter) ** 2
+    ) ** 2
+
+    # MID mixes 13.5m and 15m dishes
+    assert len(numpy.unique(diameter)) > 1
+    assert (weight[autocorr] == 0.0).all()
+    numpy.testing.assert_allclose(
+        weight[~autocorr], expected_weight[~autocorr], rtol=1e-15
+    )
+
+    # Baselines (0, a) give the antenna positions relative to antenna 0
+    uvw = vis.uvw.data[0]
+    ant_pos = uvw[ant1 == 0]
+    numpy.testing.assert_allclose(
+        uvw, ant_pos[ant2] - ant_pos[ant1], rtol=0, atol=1e-8
+    )
+
+
 def test_create_flagtable_from_visibility(visibility):
     """
     FlagTable is correctly created from input Visibility.
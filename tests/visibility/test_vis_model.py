@@ -173,6 +173,26 @@ def test_visibility_property_accessor(result_visibility):
         )
 
 
+def test_visibility_utc_time(result_visibility):
+    """
+    utc_time is cached on the accessor and rebuilt
+    when the time values are changed in place.
+    """
+    vis = result_visibility.copy(deep=True)
+    accessor_object = vis.visibility_acc
+    utc_time = accessor_object.utc_time
+
+    assert_almost_equal(utc_time.mjd, vis.time.data / 86400.0)
+    assert accessor_object.utc_time is utc_time
+
+    vis["time"].data[:] += 3600.0
+    new_utc_time = accessor_object.utc_time
+
+    assert new_utc_time is not utc_time
+    assert_almost_equal(new_utc_time.mjd, vis.time.data / 86400.0)
+    assert accessor_object.utc_time is new_utc_time
+
+
 def test_visibility_select_uv_range(result_visibility):
     """
     Check that flags are set to 1 if out of the given range
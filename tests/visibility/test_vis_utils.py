@@ -3,11 +3,18 @@ Unit tests for visibility utils.
 """
 
 import numpy
+import pytest
 from astropy import units
 from astropy.coordinates import EarthLocation, SkyCoord
 from astropy.time import Time
 
-from ska_sdp_datamodels.visibility.vis_utils import calculate_transit_time
+from ska_sdp_datamodels.visibility.vis_utils import (
+    calculate_transit_time,
+    generate_baseline_keys,
+    generate_baselines,
+    generate_baselines_array,
+    unpack_baseline_keys,
+)
 
 LOCATION = EarthLocation(
     lon=116.76444824 * units.deg, lat=-26.824722084 * units.deg, height=300.0
@@ -35,3 +42,77 @@ def test_transit_time_below_horizon():
     )
     transit_time = calculate_transit_time(LOCATION, UTC_TIME, phase_centre)
     numpy.testing.assert_array_almost_equal(transit_time.mjd, 58849.895804)
+
+
+def test_transit_time_n_grid_points(phase_centre):
+    """
+    n_grid_points is passed on to the transit search: a finer grid
+    agrees with the default to within a few seconds, while a coarse
+    grid is measurably further off
+    """
+    transit_time = calculate_transit_time(LOCATION, UTC_TIME, phase_centre)
+    fine_transit_time = calculate_transit_time(
+        LOCATION, UTC_TIME, phase_centre, n_grid_points=1000
+    )
+    coarse_transit_time = calculate_transit_time(
+        LOCATION, UTC_TIME, phase_centre, n_grid_points=20
+    )
+    numpy.testing.assert_allclose(
+        fine_transit_time.mjd, transit_time.mjd, atol=10.0 / 86400.0
+    )
+    assert (
+        numpy.abs(coarse_transit_time.mjd - fine_transit_time.mjd) * 86400.0
+        > 15.0
+    ).all()
+
+
+def test_generate_baselines_array():
+    """
+    Baseline arrays include auto-correlations and
+    match the order of generate_baselines
+    """
+    nant = 4
+    ant1, ant2 = generate_baselines_array(nant)
+
+    assert len(ant1) == nant * (nant + 1) // 2
+    assert (ant1 <= ant2).all()
+    assert list(zip(ant1, ant2)) == list(generate_baselines(nant))
+
+
+def test_generate_baseline_keys():
+    """
+    Packed baseline keys unpack to the baseline arrays
+    """
+    nant = 5
+    keys = generate_baseline_keys(nant)
+    ant1, ant2 = unpack_baseline_keys(keys)
+    expected_ant1, expected_ant2 = generate_baselines_array(nant)
+
+    assert keys.dtype == numpy.uint32
+    assert (ant1 == expected_ant1).all()
+    assert (ant2 == expected_ant2).all()
+
+
+def test_generate_baseline_keys_too_many_antennas():
+    """
+    Antenna indices above 65535 cannot be packed into keys
+    """
+    with pytest.raises(ValueError) as error:
+        generate_baseline_keys(0x10001)
+
+    assert str(error.value) == "Cannot pack baselines for 65537 antennas"
+
+
+def test_unpack_baseline_keys_max_antenna():
+    """
+    The largest antenna index (65535) round-trips through the keys
+    """
+    ant1 = numpy.array([0, 1, 65535], dtype=numpy.uint32)
+    ant2 = numpy.array([65535, 65535, 65535], dtype=numpy.uint32)
+    keys = (ant1 << 16) | ant2
+
+    result_ant1, result_ant2 = unpack_baseline_keys(keys)
+
+    assert keys[-1] == 0xFFFFFFFF
+    assert (result_ant1 == ant1).all()
+    assert (result_ant2 == ant2).all()